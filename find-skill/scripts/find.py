@@ -8,22 +8,99 @@ Usage:
     python find.py "send email" --json
 """
 
-import argparse
+import asyncio
+import functools
+import hashlib
+import http.client
 import json
 import os
 import re
+import sqlite3
 import sys
-import urllib.request
+import threading
+import time
 import urllib.parse
+from contextlib import closing
 from pathlib import Path
-from dataclasses import dataclass, asdict
-from typing import Optional
+from types import SimpleNamespace
+from typing import AsyncIterator, Iterable, NamedTuple, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Global token cache
 _github_token: Optional[str] = None
 
-@dataclass
-class SkillResult:
+# Default branch per lower-cased "owner/repo", learned from repo search results
+_default_branches: dict[str, str] = {}
+
+# Per-thread keep-alive connections, keyed by host
+_connections = threading.local()
+
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+# Response headers kept alongside cached bodies
+_CACHED_HEADERS = ("etag", "last-modified", "link")
+_LINK_LAST_RE = re.compile(r'<([^>]+)>;\s*rel="last"')
+_PAGE_PARAM_RE = re.compile(r"([?&]page=)(\d+)")
+
+# On-disk response cache (disabled with --no-cache)
+CACHE_DIR = Path.home() / ".agent-skills" / "cache"
+SEARCH_TTL = 10 * 60
+CONTENT_TTL = 60 * 60
+_cache_enabled = True
+
+# Persistent index of local skills, refreshed by SKILL.md mtime
+INDEX_PATH = Path.home() / ".agent-skills" / "index.sqlite"
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS skills (
+    path TEXT PRIMARY KEY,
+    root TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    name TEXT,
+    description TEXT NOT NULL,
+    location TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS skills_root ON skills (root);
+"""
+# Trigram full-text index over "name description", kept in sync by triggers.
+# Trigrams make MATCH behave like a case-insensitive substring test, which is
+# what local search has always done; queries under 3 characters use LIKE.
+_FTS_SCHEMA = """
+BEGIN;
+CREATE VIRTUAL TABLE skills_fts USING fts5(text, tokenize = 'trigram');
+INSERT INTO skills_fts (rowid, text) SELECT rowid, name || ' ' || description FROM skills;
+CREATE TRIGGER skills_ai AFTER INSERT ON skills BEGIN
+    INSERT INTO skills_fts (rowid, text) VALUES (new.rowid, new.name || ' ' || new.description);
+END;
+CREATE TRIGGER skills_ad AFTER DELETE ON skills BEGIN
+    DELETE FROM skills_fts WHERE rowid = old.rowid;
+END;
+CREATE TRIGGER skills_au AFTER UPDATE ON skills BEGIN
+    UPDATE skills_fts SET text = new.name || ' ' || new.description WHERE rowid = new.rowid;
+END;
+COMMIT;
+"""
+
+_REPO_ROOT_RE = re.compile(r"https://github\.com/([^/]+)/([^/]+)/?")
+_BLOB_RE = re.compile(r"https://github\.com/([^/]+)/([^/]+)/blob/([^/]+)/(.+)")
+# Top-level "key: value" lines; indented (nested) lines are skipped
+_FM_RE = re.compile(r"^([^\s:][^:\n]*):(.*)$", re.MULTILINE)
+
+_GRAPHQL_URL = "https://api.github.com/graphql"
+_GRAPHQL_TOPIC_SEARCH = (
+    "topicRepos: search(query: $q, type: REPOSITORY, first: 10) {"
+    " nodes { ... on Repository {"
+    " name nameWithOwner description url defaultBranchRef { name } } } }"
+)
+_GRAPHQL_REPO_TREE = (
+    'object(expression: "HEAD:") { ... on Tree {'
+    " entries { name type object { ... on Tree { entries { name } } } } } }"
+)
+
+class SkillResult(NamedTuple):
     name: str
     description: str
     location: str
@@ -38,6 +115,21 @@ def load_config() -> dict:
         "github": {"enabled": True, "topic": "agentskills"}
     }
 
+def json_loads(data: bytes):
+    """Decode JSON bytes, using orjson when it is installed."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def json_dumps(obj) -> bytes:
+    """Encode obj as UTF-8 JSON, using orjson when it is installed.
+
+    For internal payloads (cache entries, GraphQL requests) only: orjson
+    doesn't escape non-ASCII, so user-facing output uses json.dumps.
+    """
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode()
+
+@functools.lru_cache(maxsize=1)
 def find_env_file() -> Optional[Path]:
     """Find .env file in standard locations."""
     # Search order (first found wins):
@@ -56,6 +148,7 @@ def find_env_file() -> Optional[Path]:
             return loc
     return None
 
+@functools.lru_cache(maxsize=1)
 def load_env_file() -> dict:
     """Load variables from .env file (simple KEY=VALUE format)."""
     env_path = find_env_file()
@@ -100,6 +193,235 @@ def get_github_headers() -> dict:
         headers["Authorization"] = f"token {token}"
     return headers
 
+def _get_connection(host: str) -> http.client.HTTPSConnection:
+    """Return this thread's open connection to host, creating it if needed."""
+    pool = getattr(_connections, "pool", None)
+    if pool is None:
+        pool = _connections.pool = {}
+    conn = pool.get(host)
+    if conn is None:
+        conn = pool[host] = http.client.HTTPSConnection(host, timeout=10)
+    return conn
+
+def http_request(
+    url: str, data: Optional[bytes] = None, extra_headers: Optional[dict] = None
+) -> tuple[int, http.client.HTTPMessage, bytes]:
+    """GET a URL (POST if data is given) over a reused keep-alive connection.
+
+    Redirects are followed for GET requests.
+    """
+    method = "GET" if data is None else "POST"
+    headers = {**get_github_headers(), **(extra_headers or {})}
+    for _ in range(5):
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += f"?{parts.query}"
+        conn = _get_connection(parts.netloc)
+        try:
+            conn.request(method, path, body=data, headers=headers)
+            resp = conn.getresponse()
+        except (http.client.HTTPException, ConnectionError):
+            # The server may have dropped an idle connection; retry on a fresh one
+            conn.close()
+            conn.request(method, path, body=data, headers=headers)
+            resp = conn.getresponse()
+        body = resp.read()
+        location = resp.getheader("Location")
+        if method == "GET" and resp.status in _REDIRECT_CODES and location:
+            url = urllib.parse.urljoin(url, location)
+            continue
+        return resp.status, resp.headers, body
+    raise RuntimeError(f"Too many redirects: {url}")
+
+def _cache_path(url: str, data: Optional[bytes] = None) -> Path:
+    key = hashlib.sha1(url.encode())
+    if data is not None:
+        key.update(b"\0" + data)
+    return CACHE_DIR / f"{key.hexdigest()}.json"
+
+def _write_cache(path: Path, entry: dict) -> None:
+    """Atomically store a cache entry, ignoring failures."""
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(json_dumps(entry))
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+def cached_request(url: str, ttl: int, data: Optional[bytes] = None) -> tuple[int, dict, bytes]:
+    """Like http_request, but answer from the on-disk cache while the entry is fresh.
+
+    Stale GET entries are revalidated with If-None-Match/If-Modified-Since;
+    a 304 has no body and does not count against GitHub's rate limit.
+    Only definitive answers (200 and 404) are cached, and only the response
+    headers named in _CACHED_HEADERS are kept and returned.
+    """
+    path = _cache_path(url, data)
+    entry = None
+    if _cache_enabled:
+        try:
+            entry = json_loads(path.read_bytes())
+            if time.time() - entry["ts"] < ttl:
+                return entry["status"], entry.get("headers", {}), entry["body"].encode()
+        except (OSError, ValueError, KeyError):
+            entry = None
+
+    conditional = {}
+    if entry and data is None:
+        validators = entry.get("headers", {})
+        if "etag" in validators:
+            conditional["If-None-Match"] = validators["etag"]
+        if "last-modified" in validators:
+            conditional["If-Modified-Since"] = validators["last-modified"]
+
+    status, response_headers, body = http_request(url, data, conditional)
+    if status == 304 and entry:
+        entry["ts"] = time.time()
+        _write_cache(path, entry)
+        return entry["status"], entry.get("headers", {}), entry["body"].encode()
+
+    headers = {}
+    for name in _CACHED_HEADERS:
+        value = response_headers.get(name)
+        if value:
+            headers[name] = value
+
+    if _cache_enabled and status in (200, 404):
+        try:
+            text = body.decode()
+        except UnicodeDecodeError:
+            return status, headers, body
+        _write_cache(path, {"url": url, "ts": time.time(), "status": status, "headers": headers, "body": text})
+    return status, headers, body
+
+def daemon_map(func, items: Iterable, max_workers: int = 16) -> list:
+    """Like ThreadPoolExecutor.map, but on daemon threads, returning a list.
+
+    GitHub searches are abandoned once --limit is filled; a pool's worker
+    threads would still be joined (draining every queued request) at exit.
+    The first exception raised by func is re-raised after all items finish.
+    """
+    items = list(items)
+    outcomes = [None] * len(items)
+    jobs = iter(enumerate(items))
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                job = next(jobs, None)
+            if job is None:
+                return
+            i, item = job
+            try:
+                outcomes[i] = (func(item), None)
+            except Exception as e:
+                outcomes[i] = (None, e)
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(min(max_workers, len(items)))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for _, error in outcomes:
+        if error is not None:
+            raise error
+    return [result for result, _ in outcomes]
+
+def fetch_json(url: str, ttl: int = SEARCH_TTL):
+    """Fetch and decode a JSON document, raising on non-200 responses."""
+    status, _, body = cached_request(url, ttl)
+    if status != 200:
+        raise RuntimeError(f"HTTP {status} from {url}")
+    return json_loads(body)
+
+def fetch_json_pages(url: str, ttl: int = SEARCH_TTL) -> list:
+    """Fetch every page of a paginated JSON list.
+
+    The first page's Link header names the last page; all remaining pages
+    are then requested concurrently.
+    """
+    status, headers, body = cached_request(url, ttl)
+    if status != 200:
+        raise RuntimeError(f"HTTP {status} from {url}")
+    items = json_loads(body)
+
+    last = _LINK_LAST_RE.search(headers.get("link", ""))
+    if last:
+        last_url = last.group(1)
+        page_urls = [
+            _PAGE_PARAM_RE.sub(rf"\g<1>{page}", last_url)
+            for page in range(2, int(_PAGE_PARAM_RE.search(last_url).group(2)) + 1)
+        ]
+        for page_items in daemon_map(lambda u: fetch_json(u, ttl), page_urls, max_workers=8):
+            items.extend(page_items)
+    return items
+
+def _graphql_search(query: str, topic: str, repos: list[str]) -> Optional[tuple[list[list[str]], list[dict]]]:
+    """Run the topic search and list configured repos in a single GraphQL request.
+
+    Returns (skill directories per configured repo, repo search items), with
+    items shaped like the REST search response. Returns None when there is
+    no token (GraphQL requires auth) or the request fails, so callers can
+    fall back to REST.
+    """
+    if not get_github_token():
+        return None
+
+    params = ["$q: String!"]
+    fields = [_GRAPHQL_TOPIC_SEARCH]
+    variables = {"q": f"{query} topic:{topic}"}
+    for i, repo_name in enumerate(repos):
+        owner, _, name = repo_name.partition("/")
+        params += [f"$o{i}: String!", f"$n{i}: String!"]
+        fields.append(f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ {_GRAPHQL_REPO_TREE} }}")
+        variables[f"o{i}"] = owner
+        variables[f"n{i}"] = name
+    document = f"query({', '.join(params)}) {{ {' '.join(fields)} }}"
+    payload = json_dumps({"query": document, "variables": variables})
+
+    try:
+        status, _, body = cached_request(_GRAPHQL_URL, SEARCH_TTL, payload)
+        data = json_loads(body).get("data") if status == 200 else None
+    except Exception as e:
+        print(f"[warn] GitHub GraphQL search failed: {e}", file=sys.stderr)
+        return None
+    if not data:
+        return None
+
+    listings = []
+    for i, repo_name in enumerate(repos):
+        tree = (data.get(f"r{i}") or {}).get("object")
+        if tree is None:
+            print(f"[warn] Failed to search {repo_name}: not found", file=sys.stderr)
+            listings.append([])
+            continue
+        listings.append([
+            entry["name"] for entry in tree.get("entries", [])
+            if entry.get("type") == "tree"
+            and not entry["name"].startswith(".")
+            and any(child.get("name") == "SKILL.md" for child in (entry.get("object") or {}).get("entries", []))
+        ])
+
+    items = [
+        {
+            "name": node["name"],
+            "full_name": node["nameWithOwner"],
+            "description": node.get("description"),
+            "html_url": node["url"],
+            "default_branch": (node.get("defaultBranchRef") or {}).get("name"),
+        }
+        for node in (data.get("topicRepos") or {}).get("nodes", [])
+        if node
+    ]
+    return listings, items
+
 def parse_frontmatter(content: str) -> Optional[dict]:
     """Extract YAML frontmatter from SKILL.md content."""
     if not content.startswith("---"):
@@ -108,126 +430,254 @@ def parse_frontmatter(content: str) -> Optional[dict]:
     if end == -1:
         return None
     
-    result = {}
-    for line in content[3:end].strip().split("\n"):
-        if ":" in line and not line.startswith(" "):
-            key, value = line.split(":", 1)
-            result[key.strip()] = value.strip().strip('"').strip("'")
+    result = {
+        m.group(1).strip(): m.group(2).strip().strip('"').strip("'")
+        for m in _FM_RE.finditer(content[3:end].strip())
+    }
     return result if "name" in result else None
 
+def read_frontmatter(path: Path, cap: int = 4096) -> Optional[dict]:
+    """Parse the frontmatter of a SKILL.md, reading only its first cap characters.
+
+    Falls back to reading the whole file if the frontmatter is longer.
+    """
+    with path.open("r", encoding="utf-8") as f:
+        head = f.read(cap)
+        if head.startswith("---") and head.find("---", 3) == -1:
+            head += f.read()
+    return parse_frontmatter(head)
+
+def open_index() -> sqlite3.Connection:
+    """Open the local skill index, falling back to a throwaway in-memory one."""
+    try:
+        INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(INDEX_PATH, timeout=5)
+        conn.executescript(_INDEX_SCHEMA)
+    except (OSError, sqlite3.Error):
+        conn = sqlite3.connect(":memory:")
+        conn.executescript(_INDEX_SCHEMA)
+    # SQLite's lower() and LIKE only fold ASCII; match str.lower() instead
+    conn.create_function("py_lower", 1, lambda s: s.lower() if s is not None else None, deterministic=True)
+    _init_fts(conn)
+    return conn
+
+def _init_fts(conn: sqlite3.Connection) -> None:
+    """Create the full-text table if missing and this SQLite build supports it."""
+    if _has_fts(conn):
+        return
+    try:
+        conn.executescript(_FTS_SCHEMA)
+    except sqlite3.OperationalError:
+        # No FTS5 or trigram tokenizer: search_local falls back to LIKE
+        conn.rollback()
+
+def _has_fts(conn: sqlite3.Connection) -> bool:
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'skills_fts'").fetchone() is not None
+
+def refresh_index(conn: sqlite3.Connection, base: Path) -> str:
+    """Bring the index rows for one base folder up to date; return its root key.
+
+    Only SKILL.md files whose mtime changed are re-parsed, and rows for
+    skills that disappeared are dropped.
+    """
+    # Glob from the resolved base so every hit is already absolute
+    base = base.resolve()
+    root = str(base)
+    known = dict(conn.execute("SELECT path, mtime FROM skills WHERE root = ?", (root,)))
+
+    # Search immediate children and one level deeper (for monorepos)
+    candidates = [*base.glob("*/SKILL.md"), *base.glob("*/*/SKILL.md")]
+
+    for skill_md in candidates:
+        path = str(skill_md)
+        try:
+            mtime = skill_md.stat().st_mtime
+        except OSError:
+            continue
+        if known.pop(path, None) == mtime:
+            continue
+
+        try:
+            meta = read_frontmatter(skill_md) or {}
+        except (OSError, UnicodeDecodeError):
+            meta = {}
+        conn.execute(
+            """
+            INSERT INTO skills (path, root, mtime, name, description, location)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (path) DO UPDATE SET
+                root = excluded.root, mtime = excluded.mtime, name = excluded.name,
+                description = excluded.description, location = excluded.location
+            """,
+            (path, root, mtime, meta.get("name"), meta.get("description", ""), str(skill_md.parent)),
+        )
+
+    conn.executemany("DELETE FROM skills WHERE path = ?", [(path,) for path in known])
+    return root
+
 def search_local(query: str, paths: list[str]) -> list[SkillResult]:
     """Search local skill folders."""
     results = []
-    query_lower = query.lower()
-    
-    for path_str in paths:
-        base = Path(path_str).expanduser()
-        if not base.exists():
-            continue
-        
-        # Search immediate children and one level deeper (for monorepos)
-        search_dirs = list(base.iterdir())
-        for d in list(search_dirs):
-            if d.is_dir():
-                search_dirs.extend(d.iterdir())
-        
-        for item in search_dirs:
-            if not item.is_dir():
-                continue
-            skill_md = item / "SKILL.md"
-            if not skill_md.exists():
-                continue
-            
-            meta = parse_frontmatter(skill_md.read_text())
-            if not meta:
+
+    with closing(open_index()) as conn, conn:
+        if len(query) >= 3 and _has_fts(conn):
+            sql = """
+                SELECT s.name, s.description, s.location
+                FROM skills_fts JOIN skills s ON s.rowid = skills_fts.rowid
+                WHERE s.root = ? AND s.name IS NOT NULL AND skills_fts MATCH ?
+                ORDER BY s.location
+            """
+            term = '"' + query.replace('"', '""') + '"'
+        else:
+            sql = """
+                SELECT name, description, location FROM skills
+                WHERE root = ? AND name IS NOT NULL
+                  AND py_lower(name || ' ' || description) LIKE ? ESCAPE '\\'
+                ORDER BY location
+            """
+            term = "%" + re.sub(r"([\\%_])", r"\\\1", query.lower()) + "%"
+
+        for path_str in paths:
+            base = Path(path_str).expanduser()
+            if not base.exists():
                 continue
-            
-            searchable = f"{meta.get('name', '')} {meta.get('description', '')}".lower()
-            if query_lower in searchable:
+
+            root = refresh_index(conn, base)
+            rows = conn.execute(sql, (root, term))
+            for name, description, location in rows:
                 results.append(SkillResult(
-                    name=meta.get("name", item.name),
-                    description=meta.get("description", "")[:300],
-                    location=str(item.absolute()),
+                    name=name,
+                    description=description[:300],
+                    location=location,
                     source="local"
                 ))
     return results
 
-def search_configured_repos(query: str, repos: list[str]) -> list[SkillResult]:
-    """Search specific configured GitHub repos for skills."""
-    results = []
-    query_lower = query.lower()
+def _list_repo_dirs(repo_name: str) -> list[str]:
+    """List top-level (non-hidden) directories of a GitHub repo."""
+    contents = fetch_json_pages(f"https://api.github.com/repos/{repo_name}/contents?per_page=100")
+    return [
+        item["name"] for item in contents
+        if item.get("type") == "dir" and not item.get("name", "").startswith(".")
+    ]
 
-    for repo_name in repos:
-        try:
-            # Get repo contents (top level)
-            url = f"https://api.github.com/repos/{repo_name}/contents"
-            req = urllib.request.Request(url, headers=get_github_headers())
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                contents = json.loads(resp.read().decode())
-
-            # Look for skill directories (dirs containing SKILL.md)
-            for item in contents:
-                if item.get("type") != "dir":
-                    continue
+def _list_skill_dirs(repo_name: str) -> list[str]:
+    """List top-level directories of a GitHub repo that contain a SKILL.md.
+
+    Uses a single recursive tree request. If GitHub truncates the tree
+    (very large repos), falls back to every top-level directory; missing
+    SKILL.md files are then skipped at fetch time.
+    """
+    tree = fetch_json(f"https://api.github.com/repos/{repo_name}/git/trees/HEAD?recursive=1")
+    if tree.get("truncated"):
+        return _list_repo_dirs(repo_name)
+
+    dirs = []
+    for entry in tree.get("tree", []):
+        path = entry.get("path", "")
+        if entry.get("type") != "blob" or path.count("/") != 1:
+            continue
+        dir_name, file_name = path.split("/")
+        if file_name == "SKILL.md" and not dir_name.startswith("."):
+            dirs.append(dir_name)
+    return dirs
 
-                dir_name = item.get("name", "")
-                if dir_name.startswith("."):
-                    continue
+def _try_list_skill_dirs(repo_name: str) -> list[str]:
+    """Like _list_skill_dirs, but warn and return nothing on failure."""
+    try:
+        return _list_skill_dirs(repo_name)
+    except Exception as e:
+        print(f"[warn] Failed to search {repo_name}: {e}", file=sys.stderr)
+        return []
 
-                # Check if this directory has a SKILL.md
-                skill_url = f"https://raw.githubusercontent.com/{repo_name}/HEAD/{dir_name}/SKILL.md"
-                content = fetch_url_content(skill_url)
-                if not content:
-                    continue
+def _match_skill_dirs(query: str, repos: list[str], listings: Iterable[list[str]]) -> list[SkillResult]:
+    """Fetch the SKILL.md of each listed directory and keep those matching query."""
+    results = []
+    query_lower = query.lower()
+    candidates = [
+        (repo_name, dir_name)
+        for repo_name, dir_names in zip(repos, listings)
+        for dir_name in dir_names
+    ]
+    skill_urls = [
+        f"https://raw.githubusercontent.com/{repo_name}/HEAD/{dir_name}/SKILL.md"
+        for repo_name, dir_name in candidates
+    ]
 
-                meta = parse_frontmatter(content)
-                if not meta:
-                    continue
+    for (repo_name, dir_name), content in zip(candidates, daemon_map(fetch_url_content, skill_urls)):
+        if not content:
+            continue
 
-                # Match against query
-                searchable = f"{meta.get('name', '')} {meta.get('description', '')}".lower()
-                if query_lower in searchable:
-                    results.append(SkillResult(
-                        name=meta.get("name", dir_name),
-                        description=meta.get("description", "")[:300],
-                        location=f"https://github.com/{repo_name}/tree/HEAD/{dir_name}",
-                        source="github-configured"
-                    ))
-        except Exception as e:
-            print(f"[warn] Failed to search {repo_name}: {e}", file=sys.stderr)
+        meta = parse_frontmatter(content)
+        if not meta:
+            continue
+
+        # Match against query
+        searchable = f"{meta.get('name', '')} {meta.get('description', '')}".lower()
+        if query_lower in searchable:
+            results.append(SkillResult(
+                name=meta.get("name", dir_name),
+                description=meta.get("description", "")[:300],
+                location=f"https://github.com/{repo_name}/tree/HEAD/{dir_name}",
+                source="github-configured"
+            ))
 
     return results
 
+def search_configured_repos(query: str, repos: list[str]) -> list[SkillResult]:
+    """Search specific configured GitHub repos for skills."""
+    # List every repo concurrently, then fetch all SKILL.md files in one batch
+    return _match_skill_dirs(query, repos, daemon_map(_try_list_skill_dirs, repos))
+
 def search_github_repos(query: str, topic: str) -> list[SkillResult]:
     """Search GitHub repos with agentskills topic."""
     results = []
     try:
         q = urllib.parse.quote(f"{query} topic:{topic}")
-        url = f"https://api.github.com/search/repositories?q={q}&per_page=10"
-        req = urllib.request.Request(url, headers=get_github_headers())
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            data = json.loads(resp.read().decode())
-        
-        for repo in data.get("items", []):
-            results.append(SkillResult(
-                name=repo["name"],
-                description=(repo.get("description") or "")[:300],
-                location=repo["html_url"],
-                source="github"
-            ))
+        data = fetch_json(f"https://api.github.com/search/repositories?q={q}&per_page=10")
+        results = _repo_results(data.get("items", []))
     except Exception as e:
         print(f"[warn] GitHub repo search failed: {e}", file=sys.stderr)
     return results
 
+def _repo_results(items: list[dict]) -> list[SkillResult]:
+    """Convert repository search items to results, remembering default branches."""
+    for repo in items:
+        if repo.get("full_name") and repo.get("default_branch"):
+            _default_branches[repo["full_name"].lower()] = repo["default_branch"]
+    return [
+        SkillResult(
+            name=repo["name"],
+            description=(repo.get("description") or "")[:300],
+            location=repo["html_url"],
+            source="github"
+        )
+        for repo in items
+    ]
+
+def search_github(query: str, topic: str, repos: list[str]) -> list[SkillResult]:
+    """Search configured repos, then repos tagged with topic.
+
+    With a token, both are answered by one GraphQL request; otherwise the
+    REST searches run side by side.
+    """
+    batched = _graphql_search(query, topic, repos)
+    if batched is None:
+        configured, topic_results = daemon_map(lambda search: search(), [
+            lambda: search_configured_repos(query, repos) if repos else [],
+            lambda: search_github_repos(query, topic),
+        ])
+        return configured + topic_results
+
+    listings, items = batched
+    return _match_skill_dirs(query, repos, listings) + _repo_results(items)
+
 def search_github_code(query: str) -> list[SkillResult]:
     """Search for SKILL.md files on GitHub."""
     results = []
     try:
         q = urllib.parse.quote(f"{query} filename:SKILL.md")
-        url = f"https://api.github.com/search/code?q={q}&per_page=10"
-        req = urllib.request.Request(url, headers=get_github_headers())
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            data = json.loads(resp.read().decode())
+        data = fetch_json(f"https://api.github.com/search/code?q={q}&per_page=10")
         
         for item in data.get("items", []):
             repo = item.get("repository", {})
@@ -245,37 +695,45 @@ def search_github_code(query: str) -> list[SkillResult]:
     return results
 
 def dedupe(results: list[SkillResult]) -> list[SkillResult]:
-    seen = {}
+    """Drop results with duplicate names; local skills win over remote ones."""
+    local = {r.name.lower(): r for r in results if r.source == "local"}
+    remote = {}
     for r in results:
         key = r.name.lower()
-        if key not in seen or r.source == "local":
-            seen[key] = r
-    return list(seen.values())
+        if r.source != "local" and key not in local:
+            remote.setdefault(key, r)
+    return [*local.values(), *remote.values()]
 
 def convert_to_raw_url(github_url: str) -> Optional[str]:
     """Convert GitHub URL to raw content URL for SKILL.md."""
-    # Pattern 1: https://github.com/user/repo (repo root)
-    match = re.match(r"https://github\.com/([^/]+)/([^/]+)/?$", github_url)
+    if github_url.startswith("https://raw.githubusercontent.com/"):
+        return github_url
+
+    # Pattern 1: https://github.com/user/repo (repo root); the branch is
+    # known from search results, otherwise guess main
+    match = _REPO_ROOT_RE.fullmatch(github_url)
     if match:
         user, repo = match.groups()
-        return f"https://raw.githubusercontent.com/{user}/{repo}/main/SKILL.md"
+        branch = _default_branches.get(f"{user}/{repo}".lower(), "main")
+        return f"https://raw.githubusercontent.com/{user}/{repo}/{branch}/SKILL.md"
 
     # Pattern 2: https://github.com/user/repo/blob/branch/path/SKILL.md
-    match = re.match(r"https://github\.com/([^/]+)/([^/]+)/blob/([^/]+)/(.+)", github_url)
+    match = _BLOB_RE.match(github_url)
     if match:
         user, repo, branch, path = match.groups()
         return f"https://raw.githubusercontent.com/{user}/{repo}/{branch}/{path}"
 
     return None
 
-def fetch_url_content(url: str) -> Optional[str]:
+def fetch_url_content(url: str, ttl: int = CONTENT_TTL) -> Optional[str]:
     """Fetch content from a URL."""
     try:
-        req = urllib.request.Request(url, headers=get_github_headers())
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            return resp.read().decode("utf-8")
+        status, _, body = cached_request(url, ttl)
+        if status == 200:
+            return body.decode("utf-8")
     except Exception:
-        return None
+        pass
+    return None
 
 def fetch_skill_content(location: str, source: str) -> Optional[str]:
     """Fetch SKILL.md content from a skill location."""
@@ -291,69 +749,198 @@ def fetch_skill_content(location: str, source: str) -> Optional[str]:
             content = fetch_url_content(raw_url)
             if content:
                 return content
-            # Try master branch if main fails
-            if "/main/" in raw_url:
-                content = fetch_url_content(raw_url.replace("/main/", "/master/"))
+            # Try master branch if main was only a guess and failed
+            match = _REPO_ROOT_RE.fullmatch(location)
+            if match and "/".join(match.groups()).lower() not in _default_branches:
+                user, repo = match.groups()
+                content = fetch_url_content(f"https://raw.githubusercontent.com/{user}/{repo}/master/SKILL.md")
                 if content:
                     return content
     return None
 
-def main():
-    parser = argparse.ArgumentParser(description="Find Agent Skills")
-    parser.add_argument("query", help="What capability do you need?")
-    parser.add_argument("--local-only", action="store_true", help="Search only local folders")
-    parser.add_argument("--json", action="store_true", help="Output as JSON")
-    parser.add_argument("--fetch", action="store_true", help="Fetch and display SKILL.md content")
-    parser.add_argument("--limit", type=int, default=10, help="Maximum results (default: 10)")
-    args = parser.parse_args()
-    
-    config = load_config()
-    results = []
-    
-    results.extend(search_local(args.query, config.get("local_paths", [])))
-    
-    if not args.local_only and config.get("github", {}).get("enabled", True):
-        github_config = config.get("github", {})
+def run_in_daemon_thread(func, *args) -> asyncio.Future:
+    """Run func(*args) in a daemon thread and return a future for its result.
 
-        # Search configured repos first (most relevant)
-        configured_repos = github_config.get("repos", [])
-        if configured_repos:
-            results.extend(search_configured_repos(args.query, configured_repos))
+    Unlike asyncio.to_thread, a call whose result is no longer wanted never
+    holds the process open at exit.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
 
-        # Then search by topic
+    def deliver(result, error):
+        if future.done():
+            return
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+
+    def target():
+        try:
+            result, error = func(*args), None
+        except Exception as e:
+            result, error = None, e
+        try:
+            loop.call_soon_threadsafe(deliver, result, error)
+        except RuntimeError:
+            pass  # Event loop already closed; nobody is waiting
+
+    threading.Thread(target=target, daemon=True).start()
+    return future
+
+async def iter_results(
+    query: str, config: dict, local_only: bool = False, limit: int = 10, force_remote: bool = False
+) -> AsyncIterator[SkillResult]:
+    """Yield up to limit deduplicated results as soon as each is final.
+
+    The local scan and the GitHub searches all start at once. A search's
+    results are released when it and every higher-precedence search (local,
+    then configured/topic repos, then code search) have finished, so a
+    remote hit is never shown before a local skill of the same name.
+
+    Once limit results are out (e.g. local skills alone fill it), the
+    remaining searches are abandoned without waiting for the network,
+    unless force_remote is set.
+    """
+    tasks = [asyncio.ensure_future(asyncio.to_thread(search_local, query, config.get("local_paths", [])))]
+
+    github_config = config.get("github", {})
+    if not local_only and github_config.get("enabled", True):
+        # Configured repos first (most relevant), then repos tagged with the topic
+        configured_repos = github_config.get("repos", [])
         topic = github_config.get("topic", "agentskills")
-        results.extend(search_github_repos(args.query, topic))
+        tasks.append(run_in_daemon_thread(search_github, query, topic, configured_repos))
 
         # Finally, code search as fallback
-        results.extend(search_github_code(args.query))
-    
-    results = dedupe(results)[:args.limit]
-    
+        tasks.append(run_in_daemon_thread(search_github_code, query))
+
+    seen = set()
+    try:
+        for task in tasks:
+            if len(seen) >= limit:
+                return
+            for r in dedupe(await task):
+                key = r.name.lower()
+                if key in seen:
+                    continue
+                seen.add(key)
+                yield r
+                if len(seen) >= limit:
+                    return
+    finally:
+        if force_remote:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for task in tasks:
+            task.cancel()
+
+async def print_skill_content(i: int, r: SkillResult) -> None:
+    """Fetch a result's SKILL.md and print it as one block."""
+    content = await asyncio.to_thread(fetch_skill_content, r.location, r.source)
+    print("=" * 60)
+    print(f"[{i}] {r.name} ({r.source})")
+    print(f"Location: {r.location}")
+    print("=" * 60)
+    if content:
+        print(content)
+    else:
+        print("[Could not fetch SKILL.md content]")
+    print(flush=True)
+
+def print_no_results(query: str) -> None:
+    print(f"No skills found for: {query}")
+    print("Try broader terms, or create the skill yourself.")
+
+async def run(args: SimpleNamespace, config: dict) -> None:
+    results = iter_results(args.query, config, args.local_only, args.limit, args.force_remote)
+
     if args.json:
-        print(json.dumps([asdict(r) for r in results], indent=2))
-    elif not results:
-        print(f"No skills found for: {args.query}")
-        print("Try broader terms, or create the skill yourself.")
+        print(json.dumps([r._asdict() async for r in results], indent=2))
+    elif args.ndjson:
+        async for r in results:
+            print(json.dumps(r._asdict()), flush=True)
     elif args.fetch:
-        for i, r in enumerate(results, 1):
-            print("=" * 60)
-            print(f"[{i}] {r.name} ({r.source})")
-            print(f"Location: {r.location}")
-            print("=" * 60)
-            content = fetch_skill_content(r.location, r.source)
-            if content:
-                print(content)
-            else:
-                print("[Could not fetch SKILL.md content]")
-            print()
+        # Start each download as soon as its result arrives; print in completion order
+        fetches = []
+        async for r in results:
+            fetches.append(asyncio.create_task(print_skill_content(len(fetches) + 1, r)))
+        await asyncio.gather(*fetches)
+        if not fetches:
+            print_no_results(args.query)
     else:
-        print(f"Found {len(results)} skill(s) for \"{args.query}\":\n")
-        for i, r in enumerate(results, 1):
+        # The summary line needs the final count, so text output is not streamed
+        collected = [r async for r in results]
+        if not collected:
+            print_no_results(args.query)
+            return
+        print(f"Found {len(collected)} skill(s) for \"{args.query}\":\n")
+        for i, r in enumerate(collected, 1):
             print(f"{i}. {r.name}")
             print(f"   Location: {r.location}")
             desc = r.description[:120] + "..." if len(r.description) > 120 else r.description
             print(f"   Description: {desc}")
             print()
 
+# Boolean command-line flags and their attribute names
+_FLAGS = {
+    "--local-only": "local_only",
+    "--json": "json",
+    "--ndjson": "ndjson",
+    "--fetch": "fetch",
+    "--no-cache": "no_cache",
+    "--force-remote": "force_remote",
+}
+
+def build_parser():
+    """Build the full argparse parser (used for --help and error reporting)."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Find Agent Skills")
+    parser.add_argument("query", help="What capability do you need?")
+    parser.add_argument("--local-only", action="store_true", help="Search only local folders")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--ndjson", action="store_true", help="Output one JSON object per line as results arrive")
+    parser.add_argument("--fetch", action="store_true", help="Fetch and display SKILL.md content")
+    parser.add_argument("--limit", type=int, default=10, help="Maximum results (default: 10)")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the GitHub response cache")
+    parser.add_argument(
+        "--force-remote", action="store_true",
+        help="Finish GitHub searches even when local results already fill --limit"
+    )
+    return parser
+
+def parse_args(argv: list[str]) -> SimpleNamespace:
+    """Parse the command line, skipping argparse for ordinary invocations.
+
+    Anything unusual (--help, unknown or abbreviated flags, bad values)
+    goes through build_parser(), which also prints usage and errors.
+    """
+    args = SimpleNamespace(query=None, limit=10, **dict.fromkeys(_FLAGS.values(), False))
+    remaining = iter(argv)
+    for arg in remaining:
+        if arg in _FLAGS:
+            setattr(args, _FLAGS[arg], True)
+        elif arg == "--limit" or arg.startswith("--limit="):
+            value = arg.partition("=")[2] if "=" in arg else next(remaining, "")
+            try:
+                args.limit = int(value)
+            except ValueError:
+                break
+        elif arg.startswith("-") or args.query is not None:
+            break
+        else:
+            args.query = arg
+    else:
+        if args.query is not None:
+            return args
+    return SimpleNamespace(**vars(build_parser().parse_args(argv)))
+
+def main():
+    args = parse_args(sys.argv[1:])
+
+    global _cache_enabled
+    _cache_enabled = not args.no_cache
+
+    asyncio.run(run(args, load_config()))
+
 if __name__ == "__main__":
     main()
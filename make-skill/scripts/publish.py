@@ -13,30 +13,92 @@ Requires:
 For first-time setup, run: python init.py my-skills --public
 """
 
-import argparse
-import subprocess
+# argparse, subprocess, json, orjson, urllib, tempfile and yaml are imported where
+# they are used, so --help and argument errors don't pay for them
+import functools
+import os
+import re
+import shlex
 import sys
+import time
 from pathlib import Path
+from types import SimpleNamespace
+
+# Exit status the publish shell uses to report that nothing was staged
+_NO_CHANGES = 100
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "findable-skills"
+TOPICS_TTL = 24 * 60 * 60  # 1 day
+METADATA_CACHE_PATH = CACHE_DIR / "metadata.json"
+_cache_enabled = True  # cleared by --refresh
+
+_SSH_URL_RE = re.compile(r"^git@github\.com:(?P<path>.+?)(?:\.git)?$")
+_FRONTMATTER_RE = re.compile(r"\A---\n(.*?)\n---", re.DOTALL)
+# One flat `key: value` line with a plain, "double" or 'single' quoted scalar
+# (no escapes, flow collections, block indicators, anchors, tags or comments)
+_KV_RE = re.compile(
+    r"""^([A-Za-z_][\w-]*)[ \t]*:[ \t]*"""
+    r"""(?:"([^"\\\n]*)"|'([^'\n]*)'|([^\s"'\[{>|&*!%@`#](?:[^#\n]|(?<! )#)*?)?)[ \t]*$""",
+    re.MULTILINE,
+)
+_HEAD_CHUNK = 4 * 1024
+_HEAD_MAX = 64 * 1024
+
+
+@functools.lru_cache(maxsize=1)
+def json_decoder():
+    """Return orjson.loads if orjson is installed, otherwise json.loads."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.loads
+    return orjson.loads
+
+
+def json_loads(data: str | bytes):
+    """Decode JSON, using orjson when it is installed."""
+    return json_decoder()(data)
+
 
+def run_command(args: list, cwd: Path = None, check: bool = True, capture: bool = True) -> "subprocess.CompletedProcess":
+    """Run a shell command.
 
-def run_command(args: list, cwd: Path = None, check: bool = True) -> subprocess.CompletedProcess:
-    """Run a shell command."""
-    result = subprocess.run(args, capture_output=True, text=True, cwd=cwd)
+    With capture=False the command writes straight to our stdout/stderr.
+    """
+    import subprocess
+
+    result = subprocess.run(args, capture_output=capture, text=True, cwd=cwd)
     if check and result.returncode != 0:
-        raise RuntimeError(f"Command failed: {' '.join(args)}\n{result.stderr}")
+        raise RuntimeError(f"Command failed: {' '.join(args)}\n{result.stderr or ''}")
     return result
 
 
+def spawn_command(args: list) -> int:
+    """Run a command with our stdin/stdout/stderr and return its exit status.
+
+    POSIX only: uses os.posix_spawnp, which avoids forking the interpreter.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.posix_spawnp(args[0], args, os.environ)
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
+@functools.lru_cache(maxsize=None)
 def find_git_root(start_path: Path) -> Path | None:
     """Find the git repository root from a starting path."""
-    current = start_path.resolve()
-    while current != current.parent:
-        if (current / ".git").exists():
-            return current
-        current = current.parent
-    return None
+    try:
+        result = run_command(["git", "-C", str(start_path), "rev-parse", "--show-toplevel"], check=False)
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return Path(result.stdout.strip())
 
 
+@functools.lru_cache(maxsize=None)
 def get_repo_url(git_root: Path) -> str | None:
     """Get the GitHub URL of the repository."""
     try:
@@ -44,23 +106,117 @@ def get_repo_url(git_root: Path) -> str | None:
         if result.returncode == 0:
             url = result.stdout.strip()
             # Convert SSH to HTTPS format for display
-            if url.startswith("git@github.com:"):
-                url = url.replace("git@github.com:", "https://github.com/")
-            if url.endswith(".git"):
-                url = url[:-4]
-            return url
+            m = _SSH_URL_RE.match(url)
+            return f"https://github.com/{m.group('path')}" if m else url.removesuffix(".git")
     except Exception:
         pass
     return None
 
 
+def get_repo_slug(git_root: Path) -> str | None:
+    """Get the owner/repo name of the repository on GitHub."""
+    url = get_repo_url(git_root)
+    prefix = "https://github.com/"
+    if url and url.startswith(prefix):
+        return url[len(prefix):]
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def get_github_token() -> str | None:
+    """Get a GitHub token from the environment or from `gh auth token`."""
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+    try:
+        result = run_command(["gh", "auth", "token"], check=False)
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def _topics_cache_path(slug: str) -> Path:
+    return CACHE_DIR / "topics" / f"{slug.replace('/', '__')}.json"
+
+
+def request_topics(slug: str, names: list[str] = None) -> bytes:
+    """GET a repo's topics from the GitHub REST API, or PUT `names` as its topics."""
+    import json
+    import urllib.request
+
+    headers = {"Accept": "application/vnd.github+json"}
+    token = get_github_token()
+    if token:
+        headers["Authorization"] = f"token {token}"
+    data = None
+    if names is not None:
+        data = json.dumps({"names": names}).encode()
+        headers["Content-Type"] = "application/json"
+    request = urllib.request.Request(
+        f"https://api.github.com/repos/{slug}/topics",
+        data=data,
+        headers=headers,
+        method="GET" if data is None else "PUT",
+    )
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return response.read()
+
+
+def fetch_repo_topics(slug: str) -> list[str]:
+    """Get a repo's topics from the GitHub REST API, cached on disk for a day.
+
+    A stale cache entry is still used if GitHub can't be reached.
+    """
+    cache_path = _topics_cache_path(slug)
+    try:
+        age = time.time() - cache_path.stat().st_mtime
+    except OSError:
+        age = None
+    if _cache_enabled and age is not None and age < TOPICS_TTL:
+        return json_loads(cache_path.read_bytes())["names"]
+
+    try:
+        body = request_topics(slug)
+        topics = json_loads(body)["names"]
+    except (OSError, ValueError, KeyError):
+        if age is None:
+            raise
+        return json_loads(cache_path.read_bytes())["names"]
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_bytes(body)
+    return topics
+
+
+def add_repo_topic(slug: str, topic: str) -> None:
+    """Add a topic to a repo through the GitHub REST API and update the topics cache."""
+    # Re-read the current topics so the PUT doesn't drop any added since they were cached
+    topics = json_loads(request_topics(slug))["names"]
+    if topic not in topics:
+        topics.append(topic)
+    body = request_topics(slug, topics)
+    cache_path = _topics_cache_path(slug)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_bytes(body)
+
+
+@functools.lru_cache(maxsize=None)
 def has_agentskills_topic(git_root: Path) -> bool:
     """Check if the repo has the agentskills topic."""
+    slug = get_repo_slug(git_root)
+    if slug:
+        try:
+            return "agentskills" in fetch_repo_topics(slug)
+        except Exception:
+            pass
+
+    # Fall back to the gh CLI (e.g. a private repo without a usable token)
     try:
         result = run_command(["gh", "repo", "view", "--json", "repositoryTopics"], cwd=git_root, check=False)
         if result.returncode == 0:
-            import json
-            data = json.loads(result.stdout)
+            data = json_loads(result.stdout)
             topics = [t.get("name", "") for t in data.get("repositoryTopics", [])]
             return "agentskills" in topics
     except Exception:
@@ -68,22 +224,102 @@ def has_agentskills_topic(git_root: Path) -> bool:
     return False
 
 
-def parse_skill_metadata(skill_dir: Path) -> dict:
-    """Extract metadata from SKILL.md frontmatter."""
-    skill_md = skill_dir / "SKILL.md"
-    if not skill_md.exists():
-        raise FileNotFoundError(f"SKILL.md not found in {skill_dir}")
+def add_agentskills_topic(git_root: Path) -> None:
+    """Add the agentskills topic to the repo."""
+    slug = get_repo_slug(git_root)
+    if slug and get_github_token():
+        try:
+            add_repo_topic(slug, "agentskills")
+            return
+        except Exception:
+            pass
 
-    content = skill_md.read_text()
-    if not content.startswith("---"):
+    # Fall back to the gh CLI
+    run_command(["gh", "repo", "edit", "--add-topic", "agentskills"], cwd=git_root, check=False, capture=False)
+
+
+@functools.lru_cache(maxsize=1)
+def load_metadata_cache() -> dict:
+    """Load the on-disk cache of parsed SKILL.md frontmatter."""
+    try:
+        return json_loads(METADATA_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
         return {}
 
-    end = content.find("---", 3)
-    if end == -1:
+
+def save_metadata_cache(cache: dict) -> None:
+    """Atomically write the frontmatter cache back to disk (best effort)."""
+    import json
+    import tempfile
+
+    try:
+        METADATA_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=METADATA_CACHE_PATH.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(cache, f, default=str)
+        os.replace(tmp_path, METADATA_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def read_head(skill_md: Path) -> str:
+    """Read a SKILL.md file up to the end of its frontmatter.
+
+    Reads 4 KiB and doubles the chunk until the closing `---` shows up; past
+    64 KiB the rest of the file is read in one go.
+    """
+    with skill_md.open("rb") as f:
+        head = f.read(_HEAD_CHUNK)
+        if head.startswith(b"---"):
+            while (end := head.find(b"\n---", 3)) == -1:
+                chunk = f.read(len(head)) if len(head) < _HEAD_MAX else f.read()
+                if not chunk:
+                    break
+                head += chunk
+            else:
+                head = head[:end + 4]
+    return head.decode("utf-8", errors="replace").replace("\r\n", "\n")
+
+
+@functools.lru_cache(maxsize=1)
+def yaml_loader():
+    """Return PyYAML's safe loader class, or None if PyYAML isn't installed."""
+    try:
+        import yaml
+    except ImportError:
+        return None
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def read_frontmatter(skill_md: Path) -> dict:
+    """Parse the frontmatter of a SKILL.md file.
+
+    Flat `key: value` frontmatter is parsed with a single regex pass. Anything
+    else goes to PyYAML when it is installed, otherwise to a simple line parser.
+    """
+    match = _FRONTMATTER_RE.match(read_head(skill_md))
+    if not match:
         return {}
+    block = match.group(1)
+
+    # Fast path: every line is a simple pair
+    pairs = _KV_RE.findall(block)
+    if len(pairs) == block.count("\n") + 1:
+        return {key: double or single or plain for key, double, single, plain in pairs}
+
+    loader = yaml_loader()
+    if loader is not None:
+        import yaml
+        try:
+            data = yaml.load(block, Loader=loader)
+        except yaml.YAMLError:
+            pass
+        else:
+            return data if isinstance(data, dict) else {}
 
     metadata = {}
-    for line in content[3:end].strip().split("\n"):
+    for line in block.strip().split("\n"):
         if ":" in line and not line.startswith(" "):
             key, value = line.split(":", 1)
             metadata[key.strip()] = value.strip().strip('"').strip("'")
@@ -91,10 +327,79 @@ def parse_skill_metadata(skill_dir: Path) -> dict:
     return metadata
 
 
-def publish_skill(skill_dir: Path, message: str = None) -> str:
-    """Publish a skill by committing and pushing to the monorepo."""
-    skill_dir = skill_dir.resolve()
+def parse_skill_metadata(skill_dir: Path, st: os.stat_result = None) -> dict:
+    """Extract metadata from SKILL.md frontmatter.
+
+    Results are cached per file and reused while its mtime and size are unchanged.
+    Pass the file's stat result as `st` if the caller already has it.
+    """
+    skill_md = skill_dir / "SKILL.md"
+    if st is None:
+        try:
+            st = skill_md.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"SKILL.md not found in {skill_dir}") from None
+
+    cache = load_metadata_cache()
+    key = str(skill_md)
+    stamp = [st.st_mtime_ns, st.st_size]
+    entry = cache.get(key)
+    if _cache_enabled and entry and entry.get("stamp") == stamp:
+        return entry["metadata"]
+
+    metadata = read_frontmatter(skill_md)
+    cache[key] = {"stamp": stamp, "metadata": metadata}
+    save_metadata_cache(cache)
+    return metadata
 
+
+def publish_with_shell(git_root: Path, pathspec: str, commit_msg: str) -> int:
+    """Commit and push pathspec from a single /bin/sh process; return its exit status.
+
+    Exits with _NO_CHANGES when there is nothing to publish. Tracked changes
+    are committed straight from the pathspec; `git add` only runs when the
+    skill has untracked (??) files.
+    """
+    path = shlex.quote(pathspec)
+    script = (
+        f"cd {shlex.quote(str(git_root))} || exit; "
+        f"changes=$(git --no-optional-locks status --porcelain --untracked-files=normal -- {path}) || exit; "
+        f'[ -n "$changes" ] || exit {_NO_CHANGES}; '
+        f'case "\n$changes" in *"\n??"*) git add -- {path} || exit ;; esac; '
+        f"git commit -m {shlex.quote(commit_msg)} -- {path} && git push --porcelain"
+    )
+    return spawn_command(["/bin/sh", "-c", script])
+
+
+def publish_step_by_step(git_root: Path, pathspec: str, commit_msg: str) -> int:
+    """Like publish_with_shell, but running each git command separately."""
+    status = run_command([
+        "git", "--no-optional-locks", "status", "--porcelain", "--untracked-files=normal", "--", pathspec,
+    ], cwd=git_root, check=False)
+    if status.returncode != 0:
+        print(status.stderr, end="", file=sys.stderr)
+        return status.returncode
+    if not status.stdout.strip():
+        return _NO_CHANGES
+
+    steps = []
+    if any(line.startswith("??") for line in status.stdout.splitlines()):
+        steps.append(["git", "add", "--", pathspec])
+    steps.append(["git", "commit", "-m", commit_msg, "--", pathspec])
+    steps.append(["git", "push", "--porcelain"])
+    for step in steps:
+        returncode = run_command(step, cwd=git_root, check=False, capture=False).returncode
+        if returncode != 0:
+            return returncode
+    return 0
+
+
+def publish_skill(skill_dir: Path, message: str = None, skill_md_stat: os.stat_result = None) -> str:
+    """Publish a skill by committing and pushing to the monorepo.
+
+    skill_dir must already be resolved (main() does this); skill_md_stat is
+    passed on to parse_skill_metadata.
+    """
     # Find git root
     git_root = find_git_root(skill_dir)
     if not git_root:
@@ -103,59 +408,103 @@ def publish_skill(skill_dir: Path, message: str = None) -> str:
             "First initialize a skills repo: python init.py my-skills"
         )
 
-    # Check for agentskills topic
-    if not has_agentskills_topic(git_root):
-        print("Warning: Repo doesn't have 'agentskills' topic. Adding it now...", file=sys.stderr)
-        run_command(["gh", "repo", "edit", "--add-topic", "agentskills"], cwd=git_root, check=False)
+    # Look up the remote URL, then the topics, in the background while the
+    # metadata is parsed. One worker runs them in order, so the topic check
+    # reuses the memoized URL instead of spawning `git remote` a second time.
+    from concurrent.futures import ThreadPoolExecutor
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    repo_url = executor.submit(get_repo_url, git_root)
+    has_topic = executor.submit(has_agentskills_topic, git_root)
+    executor.shutdown(wait=False)
 
     # Get skill metadata
-    metadata = parse_skill_metadata(skill_dir)
+    metadata = parse_skill_metadata(skill_dir, skill_md_stat)
     skill_name = metadata.get("name") or skill_dir.name
 
-    # Get relative path for commit message
+    # A top-relative literal pathspec keeps git from scanning the rest of the worktree
     try:
-        rel_path = skill_dir.relative_to(git_root)
+        rel_path = skill_dir.relative_to(git_root).as_posix()
+        pathspec = f":(top,literal){rel_path}" if rel_path != "." else ":/"
     except ValueError:
-        rel_path = skill_dir.name
-
-    # Stage the skill directory
-    run_command(["git", "add", str(skill_dir)], cwd=git_root)
+        pathspec = f":(literal){skill_dir}"
 
-    # Check if there are changes to commit
-    status = run_command(["git", "status", "--porcelain", str(skill_dir)], cwd=git_root)
-    if not status.stdout.strip():
-        print("No changes to publish.")
-        repo_url = get_repo_url(git_root)
-        return repo_url or str(git_root)
+    # Check for agentskills topic
+    if not has_topic.result():
+        print("Warning: Repo doesn't have 'agentskills' topic. Adding it now...", file=sys.stderr)
+        add_agentskills_topic(git_root)
 
-    # Commit
     commit_msg = message or f"Add skill: {skill_name}"
-    run_command(["git", "commit", "-m", commit_msg], cwd=git_root)
+    if os.name == "posix":
+        returncode = publish_with_shell(git_root, pathspec, commit_msg)
+    else:
+        # No /bin/sh (e.g. native Windows)
+        returncode = publish_step_by_step(git_root, pathspec, commit_msg)
+    if returncode == _NO_CHANGES:
+        print("No changes to publish.")
+    elif returncode != 0:
+        raise RuntimeError(f"git exited with status {returncode} while publishing")
 
-    # Push
-    run_command(["git", "push"], cwd=git_root)
+    return repo_url.result() or str(git_root)
 
-    repo_url = get_repo_url(git_root)
-    return repo_url or str(git_root)
 
+def build_parser():
+    """Build the full argparse parser (used for --help and error reporting)."""
+    import argparse
 
-def main():
     parser = argparse.ArgumentParser(description="Publish a skill to your skills monorepo")
     parser.add_argument("skill_dir", help="Path to skill directory")
     parser.add_argument("--message", "-m", help="Custom commit message")
-    args = parser.parse_args()
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached repo topics and skill metadata")
+    return parser
+
+
+def parse_args(argv: list[str]) -> SimpleNamespace:
+    """Parse the command line, skipping argparse for ordinary invocations.
+
+    Anything unusual (--help, unknown flags, a missing value) goes through
+    build_parser(), which also prints usage and errors.
+    """
+    args = SimpleNamespace(skill_dir=None, message=None, refresh=False)
+    remaining = iter(argv)
+    for arg in remaining:
+        if arg == "--refresh":
+            args.refresh = True
+        elif arg in ("--message", "-m"):
+            args.message = next(remaining, None)
+            if args.message is None:
+                break
+        elif arg.startswith("--message="):
+            args.message = arg.partition("=")[2]
+        elif arg.startswith("-") or args.skill_dir is not None:
+            break
+        else:
+            args.skill_dir = arg
+    else:
+        if args.skill_dir is not None:
+            return args
+    return SimpleNamespace(**vars(build_parser().parse_args(argv)))
 
-    skill_dir = Path(args.skill_dir).expanduser().resolve()
-    if not skill_dir.exists():
-        print(f"Error: Directory not found: {skill_dir}", file=sys.stderr)
-        sys.exit(1)
 
-    if not (skill_dir / "SKILL.md").exists():
-        print(f"Error: No SKILL.md found in {skill_dir}", file=sys.stderr)
+def main():
+    args = parse_args(sys.argv[1:])
+
+    global _cache_enabled
+    _cache_enabled = not args.refresh
+
+    skill_dir = Path(args.skill_dir).expanduser().resolve()
+    # One stat answers both checks in the common case
+    try:
+        skill_md_stat = os.stat(skill_dir / "SKILL.md")
+    except (FileNotFoundError, NotADirectoryError):
+        if not skill_dir.exists():
+            print(f"Error: Directory not found: {skill_dir}", file=sys.stderr)
+        else:
+            print(f"Error: No SKILL.md found in {skill_dir}", file=sys.stderr)
         sys.exit(1)
 
     try:
-        url = publish_skill(skill_dir, args.message)
+        url = publish_skill(skill_dir, args.message, skill_md_stat)
         print(f"Published to: {url}")
         print()
         print("Your skill is now discoverable via find-skill!")